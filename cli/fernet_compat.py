@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Fernet Compatibility Module
+--------------------------
+Picks the fastest available Fernet implementation behind one bytes-based API,
+and provides an AES-GCM cipher with the same API.
+"""
+import os
+
+try:
+    import rfernet
+except ImportError:
+    rfernet = None
+
+# AES-GCM nonce length in bytes
+NONCE_SIZE = 12
+
+class RFernet:
+    """Adapts rfernet's str-based API to cryptography's bytes-based Fernet API"""
+
+    def __init__(self, key):
+        self._fernet = rfernet.Fernet(key.decode())
+
+    def encrypt(self, data):
+        """Encrypt bytes and return the token as bytes"""
+        return self._fernet.encrypt(data).encode()
+
+    def decrypt(self, token):
+        """Decrypt a bytes token and return the plaintext bytes"""
+        return self._fernet.decrypt(token.decode())
+
+def make_fernet(key):
+    """
+    Create a Fernet cipher, preferring the Rust-backed rfernet when installed
+
+    Args:
+        key (bytes): 32-byte urlsafe base64-encoded Fernet key
+
+    Returns:
+        object: Cipher with encrypt(bytes) -> bytes and decrypt(bytes) -> bytes
+    """
+    if rfernet is not None:
+        return RFernet(key)
+
+    # Imported here so callers only load cryptography when they need it
+    from cryptography.fernet import Fernet
+    return Fernet(key)
+
+class AesGcmCipher:
+    """AES-GCM cipher exposing the same encrypt/decrypt API as Fernet"""
+
+    def __init__(self, key):
+        # Imported here so callers only load cryptography when they need it
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        self._aead = AESGCM(key)
+
+    def encrypt(self, data):
+        """Encrypt bytes to nonce + ciphertext"""
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, data, None)
+
+    def decrypt(self, token):
+        """Decrypt nonce + ciphertext back to bytes"""
+        return self._aead.decrypt(token[:NONCE_SIZE], token[NONCE_SIZE:], None)
@@ -18,6 +18,22 @@ from cli.secure_payment import SecurePaymentProcessor
 from cli.agreement_manager import AgreementManager
 from cli.signature_handler import SignatureHandler
 
+def _transaction_in_cents(transaction):
+    """Convert a transaction logged in dollars by earlier versions to cents"""
+    if "amount" not in transaction:
+        return transaction
+    
+    migrated = {key: value for key, value in transaction.items()
+                if key not in ("amount", "owner_amount", "partner_amount")}
+    
+    # Re-split the total the way process_revenue_share does, so the shares
+    # add up to it exactly instead of carrying over float rounding
+    amount_cents = round(transaction["amount"] * 100)
+    migrated["amount_cents"] = amount_cents
+    migrated["owner_cents"] = amount_cents >> 1
+    migrated["partner_cents"] = amount_cents - (amount_cents >> 1)
+    return migrated
+
 class IntegrationManager:
     """Manages integration of all Str8ZeROCLI components"""
     
@@ -139,9 +155,9 @@ class IntegrationManager:
         
         return result
     
-    def process_revenue(self, app_id, amount):
-        """Process revenue for an app"""
-        result = self.payment_processor.process_revenue_share(amount, app_id)
+    def process_revenue(self, app_id, amount_cents):
+        """Process revenue for an app, given the amount in cents"""
+        result = self.payment_processor.process_revenue_share(amount_cents, app_id)
         
         if result.get("success", False):
             # Log the transaction
@@ -155,12 +171,15 @@ class IntegrationManager:
                 except:
                     transactions = []
             
+            # Older entries recorded dollar amounts; keep the log in one schema
+            transactions = [_transaction_in_cents(t) for t in transactions]
+            
             transactions.append({
                 "timestamp": datetime.now().isoformat(),
                 "app_id": app_id,
-                "amount": amount,
-                "owner_amount": result.get("owner_amount"),
-                "partner_amount": result.get("partner_amount")
+                "amount_cents": amount_cents,
+                "owner_cents": result.get("owner_cents"),
+                "partner_cents": result.get("partner_cents")
             })
             
             with open(transaction_log, 'w') as f:
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Machine ID Module
+----------------
+Provides the device fingerprint used to derive local encryption keys.
+"""
+import platform
+import uuid
+from functools import lru_cache
+from hashlib import sha256
+
+@lru_cache(maxsize=1)
+def machine_fingerprint():
+    """
+    Get a stable fingerprint for this machine
+    
+    Computed once per process, since the identifiers can't change while it runs.
+    This is a simplified version - in production use more robust machine fingerprinting.
+    
+    Returns:
+        str: Hex SHA-256 of the OS name, OS version and MAC address
+    """
+    h = sha256()
+    h.update(platform.system().encode())
+    h.update(platform.version().encode())
+    h.update(str(uuid.getnode()).encode())  # MAC address as integer
+    return h.hexdigest()
@@ -8,11 +8,11 @@ from datetime import datetime
 from pathlib import Path
 
 # Import our new modules
-from mood_detector import MoodDetector
+from mood_detector import get_mood_detector
 from agents import get_agent
 from custom_agents import CustomAgentLoader
 from api_manager import ApiKeyManager
-from profile_manager import ProfileManager
+from profile_manager import get_profile_manager
 
 @click.command()
 @click.argument('prompt', required=True)
@@ -31,7 +31,7 @@ def cli(prompt, task, platform, explain, override, create_agent, list_agents, ap
     
     # Initialize custom agent loader and profile manager
     custom_agent_loader = CustomAgentLoader()
-    profile_manager = ProfileManager()
+    profile_manager = get_profile_manager()
     
     # Load profile
     user_profile = profile_manager.get_profile(profile)
@@ -114,7 +114,7 @@ def cli(prompt, task, platform, explain, override, create_agent, list_agents, ap
 def route_agent(prompt, task, platform, override=None, custom_agent_loader=None):
     """Route to optimal agent based on prompt analysis"""
     # Initialize mood detector
-    mood_detector = MoodDetector()
+    mood_detector = get_mood_detector()
     
     # Parse mood and syntax
     mood = mood_detector.detect_emotion(prompt)
@@ -6,10 +6,38 @@ Analyzes app store trends and identifies profitable niches and opportunities.
 """
 import os
 import json
+import heapq
 import random
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Lower bounds of the rating buckets and their labels, lowest bucket first
+RATING_EDGES = (3.0, 3.5, 4.0, 4.5)
+RATING_LABELS = ("0.0-3.0", "3.0-3.5", "3.5-4.0", "4.0-4.5", "4.5-5.0")
+
+# Size of the per-app trigram Bloom filter used to prefilter keyword searches
+BLOOM_BITS = 512
+
+def _trigram_bloom(text):
+    """Build a Bloom filter (as an int) over the character trigrams of text"""
+    bloom = 0
+    for i in range(len(text) - 2):
+        bloom |= 1 << (hash(text[i:i + 3]) % BLOOM_BITS)
+    return bloom
+
 class MarketAnalyzer:
     """Analyzes app markets to find profitable opportunities"""
     
@@ -17,6 +45,7 @@ class MarketAnalyzer:
         """Initialize the market analyzer"""
         self.data_path = os.path.join(Path.home(), "Str8ZeROCLI", "data", "market_data.json")
         self.cache_path = os.path.join(Path.home(), "Str8ZeROCLI", "data", "market_cache.json")
+        self.lock_path = self.data_path + ".lock"
         
         # Ensure data directory exists
         os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
@@ -37,7 +66,11 @@ class MarketAnalyzer:
         """
         # Update market data if needed
         if self._should_update_data():
-            self._update_market_data()
+            with self._update_lock():
+                # Another process may have refreshed the data while we waited
+                self.market_data = self._load_market_data()
+                if self._should_update_data():
+                    self._update_market_data()
         
         # Filter by category if provided
         if category:
@@ -48,12 +81,12 @@ class MarketAnalyzer:
         
         # Filter by keywords if provided
         if keywords:
+            # Every trigram of a keyword must be in an app's filter for it to match
+            query = [(keyword.lower(), _trigram_bloom(keyword.lower())) for keyword in keywords]
             keyword_apps = []
             for app in relevant_apps:
-                for keyword in keywords:
-                    if (keyword.lower() in app.get("name", "").lower() or
-                        keyword.lower() in app.get("description", "").lower() or
-                        keyword.lower() in " ".join(app.get("keywords", []))):
+                for keyword, qbloom in query:
+                    if app["_bloom"] & qbloom == qbloom and keyword in app["_lc"]:
                         keyword_apps.append(app)
                         break
             relevant_apps = keyword_apps
@@ -77,7 +110,18 @@ class MarketAnalyzer:
         try:
             if os.path.exists(self.data_path):
                 with open(self.data_path, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
+                
+                # Backfill epoch timestamps for data saved by older versions
+                for app in data.get("apps", []):
+                    if "last_updated_ts" not in app:
+                        try:
+                            app["last_updated_ts"] = datetime.fromisoformat(app.get("last_updated", "")).timestamp()
+                        except (TypeError, ValueError):
+                            app["last_updated_ts"] = None
+                
+                self._index_apps(data.get("apps", []))
+                return data
         except Exception as e:
             print(f"Error loading market data: {e}")
         
@@ -126,6 +170,10 @@ class MarketAnalyzer:
                 price = 0
                 
             downloads = int(10 ** random.uniform(3, 6))  # 1K to 1M
+            last_updated = datetime.now().replace(
+                day=random.randint(1, 28),
+                month=random.randint(1, 12)
+            )
             
             apps.append({
                 "id": f"app_{i}",
@@ -137,10 +185,8 @@ class MarketAnalyzer:
                 "price_model": price_model,
                 "price": price,
                 "downloads": downloads,
-                "last_updated": (datetime.now().replace(
-                    day=random.randint(1, 28),
-                    month=random.randint(1, 12)
-                )).isoformat(),
+                "last_updated": last_updated.isoformat(),
+                "last_updated_ts": last_updated.timestamp(),
                 "keywords": [f"keyword_{j}" for j in range(random.randint(3, 10))]
             })
         
@@ -153,8 +199,51 @@ class MarketAnalyzer:
         }
         
         # Save to file
-        with open(self.data_path, 'w') as f:
-            json.dump(self.market_data, f, indent=2)
+        self._save_market_data()
+        
+        self._index_apps(apps)
+    
+    def _save_market_data(self):
+        """Atomically replace the market data file with the current data"""
+        if orjson is not None:
+            payload = orjson.dumps(self.market_data)
+        else:
+            payload = json.dumps(self.market_data, separators=(",", ":")).encode()
+        
+        # Write to a temp file first so a crash never leaves a truncated cache
+        tmp_path = self.data_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.data_path)
+    
+    @contextmanager
+    def _update_lock(self):
+        """Hold an exclusive lock so concurrent CLI runs don't both regenerate data"""
+        if fcntl is None:
+            yield
+            return
+        
+        with open(self.lock_path, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _index_apps(self, apps):
+        """Precompute lowercase search text and trigram filters for each app
+        
+        These fields are in-memory only: hash() is salted per process, so they
+        must be rebuilt on load rather than persisted with the market data.
+        """
+        for app in apps:
+            # Fields are joined with NUL so a keyword can't match across them
+            app["_lc"] = "\0".join([
+                app.get("name", ""),
+                app.get("description", ""),
+                " ".join(app.get("keywords", []))
+            ]).lower()
+            app["_bloom"] = _trigram_bloom(app["_lc"])
     
     def _generate_trends(self, apps, categories):
         """Generate market trends from app data"""
@@ -187,26 +276,11 @@ class MarketAnalyzer:
         })
         
         # Rating distribution
-        rating_ranges = {
-            "4.5-5.0": 0,
-            "4.0-4.5": 0,
-            "3.5-4.0": 0,
-            "3.0-3.5": 0,
-            "0.0-3.0": 0
-        }
-        
+        buckets = [0] * len(RATING_LABELS)
         for app in apps:
-            rating = app.get("rating", 0)
-            if rating >= 4.5:
-                rating_ranges["4.5-5.0"] += 1
-            elif rating >= 4.0:
-                rating_ranges["4.0-4.5"] += 1
-            elif rating >= 3.5:
-                rating_ranges["3.5-4.0"] += 1
-            elif rating >= 3.0:
-                rating_ranges["3.0-3.5"] += 1
-            else:
-                rating_ranges["0.0-3.0"] += 1
+            buckets[bisect_right(RATING_EDGES, app.get("rating", 0))] += 1
+        
+        rating_ranges = dict(zip(reversed(RATING_LABELS), reversed(buckets)))
         
         trends.append({
             "name": "Rating Distribution",
@@ -260,24 +334,25 @@ class MarketAnalyzer:
                 })
         
         # Look for outdated but popular apps
+        now_ts = time.time()
         for app in apps:
             if app.get("downloads", 0) > 100000:
-                try:
-                    last_updated = datetime.fromisoformat(app.get("last_updated", ""))
-                    months_since_update = (datetime.now() - last_updated).days / 30
-                    
-                    if months_since_update > 6:
-                        opportunities.append({
-                            "type": "outdated_app",
-                            "app_name": app.get("name"),
-                            "category": app.get("categories", ["unknown"])[0],
-                            "downloads": app.get("downloads"),
-                            "months_since_update": round(months_since_update, 1),
-                            "potential": "high",
-                            "description": f"Popular app not updated in {round(months_since_update, 1)} months"
-                        })
-                except:
-                    pass
+                last_updated_ts = app.get("last_updated_ts")
+                if last_updated_ts is None:
+                    continue
+                
+                months_since_update = (now_ts - last_updated_ts) // 86400 / 30
+                
+                if months_since_update > 6:
+                    opportunities.append({
+                        "type": "outdated_app",
+                        "app_name": app.get("name"),
+                        "category": app.get("categories", ["unknown"])[0],
+                        "downloads": app.get("downloads"),
+                        "months_since_update": round(months_since_update, 1),
+                        "potential": "high",
+                        "description": f"Popular app not updated in {round(months_since_update, 1)} months"
+                    })
         
         return opportunities
     
@@ -324,12 +399,9 @@ class MarketAnalyzer:
                 "top_competitors": []
             }
         
-        # Sort by downloads
-        sorted_apps = sorted(apps, key=lambda x: x.get("downloads", 0), reverse=True)
-        
-        # Get top competitors
+        # Get top competitors by downloads
         top_competitors = []
-        for app in sorted_apps[:5]:
+        for app in heapq.nlargest(5, apps, key=lambda x: x.get("downloads", 0)):
             top_competitors.append({
                 "name": app.get("name"),
                 "downloads": app.get("downloads"),
@@ -2,14 +2,19 @@
 import re
 import os
 import json
+import threading
 from collections import defaultdict
 
+_mood_detector = None
+_mood_detector_lock = threading.Lock()
+
 class MoodDetector:
     """Advanced mood detection for agent routing"""
     
     def __init__(self):
         self.emotion_lexicon = self._load_emotion_lexicon()
         self.syntax_patterns = self._load_syntax_patterns()
+        self._context_rules = self._compile_context_rules()
         
     def _load_emotion_lexicon(self):
         """Load emotion lexicon from file or use default"""
@@ -80,10 +85,26 @@ class MoodDetector:
         except:
             return default_patterns
     
+    def _compile_context_rules(self):
+        """Compile the phrase-based context rules to (regex, emotion, weight) tuples"""
+        rules = [
+            # Both words anywhere in the prompt, in either order
+            (r"freedom.*expression|expression.*freedom", "rebellious"),
+            (r"clean.*code|code.*clean", "elegant"),
+            # Any one of the phrases
+            (r"like the old days|remember when", "nostalgic"),
+            (r"cutting edge|next generation", "futuristic"),
+            (r"no errors|perfect output", "precise"),
+            (r"deadline|as soon as possible", "rapid"),
+            (r"make sure|double check", "cautious")
+        ]
+        return [(re.compile(pattern, re.DOTALL), emotion, 0.4) for pattern, emotion in rules]
+    
     def detect_emotion(self, prompt):
         """Detect emotional signals in prompt with advanced NLP techniques"""
         prompt_lower = prompt.lower()
         emotions = defaultdict(float)
+        max_score = 0.0
         
         # Count emotion words
         for emotion, keywords in self.emotion_lexicon.items():
@@ -102,37 +123,18 @@ class MoodDetector:
                     for intensifier in intensifiers:
                         if f"{intensifier} {keyword}" in prompt_lower:
                             emotions[emotion] += 0.2
+                    
+                    max_score = max(max_score, emotions[emotion])
                             
         # Context-based analysis
-        if "freedom" in prompt_lower and "expression" in prompt_lower:
-            emotions["rebellious"] += 0.4
-            
-        if "clean" in prompt_lower and "code" in prompt_lower:
-            emotions["elegant"] += 0.4
-            
-        if "like the old days" in prompt_lower or "remember when" in prompt_lower:
-            emotions["nostalgic"] += 0.4
-            
-        if "cutting edge" in prompt_lower or "next generation" in prompt_lower:
-            emotions["futuristic"] += 0.4
+        for regex, emotion, weight in self._context_rules:
+            if regex.search(prompt_lower):
+                emotions[emotion] += weight
+                max_score = max(max_score, emotions[emotion])
             
-        if "no errors" in prompt_lower or "perfect output" in prompt_lower:
-            emotions["precise"] += 0.4
-            
-        if "deadline" in prompt_lower or "as soon as possible" in prompt_lower:
-            emotions["rapid"] += 0.4
-            
-        if "make sure" in prompt_lower or "double check" in prompt_lower:
-            emotions["cautious"] += 0.4
-            
-        # Normalize scores to 0-1 range
-        max_score = max(emotions.values()) if emotions else 0
-        if max_score > 0:
-            for emotion in emotions:
-                emotions[emotion] = min(emotions[emotion] / max_score, 1.0)
-                
-        # Return top emotions
-        return {k: v for k, v in emotions.items() if v > 0.3}
+        # Normalize scores to 0-1 range and keep the top emotions in one pass
+        inv_max = 1.0 / max_score if max_score else 0.0
+        return {k: min(v * inv_max, 1.0) for k, v in emotions.items() if v * inv_max > 0.3}
         
     def analyze_syntax(self, prompt):
         """Analyze syntax patterns in prompt with regex matching"""
@@ -162,4 +164,13 @@ class MoodDetector:
         if "connect to" in prompt_lower or "integrate with" in prompt_lower:
             syntax["API-bindings"] = True
             
-        return syntax
\ No newline at end of file
+        return syntax
+
+def get_mood_detector():
+    """Return the process-wide MoodDetector, creating it on first use"""
+    global _mood_detector
+    if _mood_detector is None:
+        with _mood_detector_lock:
+            if _mood_detector is None:
+                _mood_detector = MoodDetector()
+    return _mood_detector
\ No newline at end of file
@@ -1,8 +1,32 @@
 #!/usr/bin/env python3
 import os
+import threading
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Use libyaml's C emitter when PyYAML was built with it; CDumper represents
+# the same types as yaml.dump's default Dumper, so saved profiles don't change
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+# Written verbatim on first run instead of going through the YAML emitter
+DEFAULT_PROFILE_YAML = """\
+name: Default
+description: Default profile for Str8ZeROCLI
+preferences:
+  theme: dark
+  auto_commit: true
+  telemetry: minimal
+  default_task: app-gen
+  default_platform: all
+  default_agent: Aider
+  api_keys:
+    use_env: true
+"""
+
+_profile_manager = None
+_profile_manager_lock = threading.Lock()
+
 class ProfileManager:
     """Manages user profiles for Str8ZeROCLI"""
     
@@ -15,24 +39,8 @@ class ProfileManager:
         # Create default profile if it doesn't exist
         default_profile_path = os.path.join(self.profiles_dir, "default.yaml")
         if not os.path.exists(default_profile_path):
-            default_profile = {
-                "name": "Default",
-                "description": "Default profile for Str8ZeROCLI",
-                "preferences": {
-                    "theme": "dark",
-                    "auto_commit": True,
-                    "telemetry": "minimal",
-                    "default_task": "app-gen",
-                    "default_platform": "all",
-                    "default_agent": "Aider",
-                    "api_keys": {
-                        "use_env": True
-                    }
-                }
-            }
-            
             with open(default_profile_path, 'w') as f:
-                yaml.dump(default_profile, f, default_flow_style=False)
+                f.write(DEFAULT_PROFILE_YAML)
     
     def get_profile(self, profile_name="default"):
         """Get a profile by name"""
@@ -62,26 +70,31 @@ class ProfileManager:
     
     def list_profiles(self):
         """List all available profiles"""
-        profiles = []
+        paths = list(Path(self.profiles_dir).glob("*.yaml"))
+        if not paths:
+            return []
         
-        for file_path in Path(self.profiles_dir).glob("*.yaml"):
-            profile_name = file_path.stem
-            try:
-                with open(file_path, 'r') as f:
-                    profile = yaml.safe_load(f)
-                    profiles.append({
-                        "name": profile.get("name", profile_name),
-                        "description": profile.get("description", ""),
-                        "path": str(file_path)
-                    })
-            except:
-                profiles.append({
-                    "name": profile_name,
-                    "description": "Error loading profile",
-                    "path": str(file_path)
-                })
-        
-        return profiles
+        # Profile reads are I/O-bound, so overlap them on a small thread pool
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return list(executor.map(self._load_profile_summary, paths))
+    
+    def _load_profile_summary(self, file_path):
+        """Load the name and description of a single profile file"""
+        profile_name = file_path.stem
+        try:
+            with open(file_path, 'r') as f:
+                profile = yaml.safe_load(f)
+            return {
+                "name": profile.get("name", profile_name),
+                "description": profile.get("description", ""),
+                "path": str(file_path)
+            }
+        except:
+            return {
+                "name": profile_name,
+                "description": "Error loading profile",
+                "path": str(file_path)
+            }
     
     def create_profile(self, profile_name, preferences=None):
         """Create a new profile"""
@@ -103,7 +116,7 @@ class ProfileManager:
         
         try:
             with open(profile_path, 'w') as f:
-                yaml.dump(profile, f, default_flow_style=False)
+                yaml.dump(profile, f, Dumper=YAML_DUMPER, default_flow_style=False)
                 
             return {
                 "success": True,
@@ -136,7 +149,7 @@ class ProfileManager:
             
             # Save profile
             with open(profile_path, 'w') as f:
-                yaml.dump(profile, f, default_flow_style=False)
+                yaml.dump(profile, f, Dumper=YAML_DUMPER, default_flow_style=False)
                 
             return {
                 "success": True,
@@ -146,4 +159,13 @@ class ProfileManager:
             return {
                 "success": False,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+
+def get_profile_manager():
+    """Return the process-wide ProfileManager, creating it on first use"""
+    global _profile_manager
+    if _profile_manager is None:
+        with _profile_manager_lock:
+            if _profile_manager is None:
+                _profile_manager = ProfileManager()
+    return _profile_manager
\ No newline at end of file
@@ -6,13 +6,16 @@ Handles secure payment processing and revenue sharing.
 """
 import os
 import json
-import base64
-import hashlib
-import requests
 from pathlib import Path
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cli.secure_store import (
+    KDF_VERSION, derive_cipher, ensure_dir, new_key_header,
+    read_encrypted, read_key_header, write_encrypted
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class SecurePaymentProcessor:
     """Handles secure payment processing and revenue sharing"""
@@ -22,51 +25,32 @@ class SecurePaymentProcessor:
         self.config_dir = os.path.join(Path.home(), "Str8ZeROCLI", "secure")
         self.keys_file = os.path.join(self.config_dir, "payment_keys.enc")
         
+        # Salt file used by data from before the key header layout
+        self.legacy_salt_file = os.path.join(self.config_dir, "salt.bin")
+        
         # Ensure directory exists
-        os.makedirs(self.config_dir, exist_ok=True)
+        ensure_dir(self.config_dir)
         
         # Initialize encryption
         self._setup_encryption()
         
+        # The keys file only changes in store_payment_info, so stat it once here
+        self._keys_mtime = os.path.getmtime(self.keys_file) if os.path.exists(self.keys_file) else None
+        
+        # Decrypted payment info, loaded on first use and replaced on store
+        self._payment_info_cache = None
+        
     def _setup_encryption(self):
         """Set up encryption for secure storage"""
-        # Use a device-specific salt (or create one if it doesn't exist)
-        salt_file = os.path.join(self.config_dir, "salt.bin")
-        if os.path.exists(salt_file):
-            with open(salt_file, "rb") as f:
-                self.salt = f.read()
-        else:
-            self.salt = os.urandom(16)
-            with open(salt_file, "wb") as f:
-                f.write(self.salt)
-        
-        # Use machine-specific info as password base
-        machine_info = self._get_machine_info()
-        password = machine_info.encode()
-        
-        # Generate key
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password))
-        self.cipher = Fernet(key)
+        # Reuse the KDF version and salt of existing data; a new salt is only
+        # persisted with the first stored data
+        header = read_key_header(self.keys_file, self.legacy_salt_file)
+        self._init_cipher(*(header or new_key_header()))
     
-    def _get_machine_info(self):
-        """Get unique machine info for encryption"""
-        # This is a simplified version - in production use more robust machine fingerprinting
-        import platform
-        import uuid
-        
-        # Get machine-specific identifiers
-        system_info = platform.system() + platform.version()
-        machine_id = str(uuid.getnode())  # MAC address as integer
-        
-        # Combine and hash
-        combined = system_info + machine_id
-        return hashlib.sha256(combined.encode()).hexdigest()
+    def _init_cipher(self, kdf_version, salt):
+        """Switch to the cipher for a KDF version and salt"""
+        self.kdf_version, self.salt = kdf_version, salt
+        self.cipher = derive_cipher(kdf_version, salt)
     
     def store_payment_info(self, stripe_account_id, api_key):
         """Securely store payment information"""
@@ -77,30 +61,57 @@ class SecurePaymentProcessor:
             "brand": "Str8ZeRO"
         }
         
+        # Always stored as JSON, so reading it never depends on an optional
+        # package; orjson only speeds up the encoding
+        if orjson is not None:
+            plaintext = orjson.dumps(data)
+        else:
+            plaintext = json.dumps(data).encode()
+        
+        # Another processor may have stored data since this one was set up;
+        # keep using its salt rather than replacing it
+        header = read_key_header(self.keys_file, self.legacy_salt_file)
+        if header is not None and header != (self.kdf_version, self.salt):
+            self._init_cipher(*header)
+        
+        # Move data from older key schemes to the current one as it's rewritten
+        if self.kdf_version != KDF_VERSION:
+            self._init_cipher(*new_key_header())
+        
         # Encrypt the data
-        encrypted_data = self.cipher.encrypt(json.dumps(data).encode())
+        encrypted_data = self.cipher.encrypt(plaintext)
         
-        # Save to file
-        with open(self.keys_file, "wb") as f:
-            f.write(encrypted_data)
+        # Save to file, prefixed with the header needed to derive the key again
+        write_encrypted(self.keys_file, self.kdf_version, self.salt, encrypted_data, self.legacy_salt_file)
+        self._keys_mtime = os.path.getmtime(self.keys_file)
+        self._payment_info_cache = data
         
         return True
     
     def get_payment_info(self):
         """Retrieve securely stored payment information"""
-        if not os.path.exists(self.keys_file):
-            return None
+        if self._payment_info_cache is not None:
+            return self._payment_info_cache
         
         try:
-            # Read encrypted data
-            with open(self.keys_file, "rb") as f:
-                encrypted_data = f.read()
+            # Read encrypted data along with the key header it was written with
+            stored = read_encrypted(self.keys_file, self.legacy_salt_file)
+            if stored is None:
+                return None
+            header, encrypted_data = stored
+            
+            # Another processor may have stored it with a different salt
+            if header != (self.kdf_version, self.salt):
+                self._init_cipher(*header)
             
             # Decrypt
             decrypted_data = self.cipher.decrypt(encrypted_data)
             
-            # Parse JSON
-            return json.loads(decrypted_data.decode())
+            if orjson is not None:
+                self._payment_info_cache = orjson.loads(decrypted_data)
+            else:
+                self._payment_info_cache = json.loads(decrypted_data.decode())
+            return self._payment_info_cache
         except Exception:
             return None
     
@@ -121,18 +132,32 @@ class SecurePaymentProcessor:
             "owner_share": 50,  # 50% revenue share
             "partner": partner_stripe_account,
             "partner_share": 50,  # 50% revenue share
-            "agreement_timestamp": os.path.getmtime(self.keys_file) if os.path.exists(self.keys_file) else None
+            "agreement_timestamp": self._keys_mtime
         }
     
-    def process_revenue_share(self, amount, app_id):
-        """Process a revenue share payment"""
+    def process_revenue_share(self, amount_cents, app_id):
+        """
+        Process a revenue share payment
+        
+        Args:
+            amount_cents (int): Payment amount in cents
+            app_id (str): The app the payment belongs to
+        
+        Returns:
+            dict: Result with the owner's and partner's shares in cents
+        """
         payment_info = self.get_payment_info()
         if not payment_info:
             return {"success": False, "error": "Payment information not configured"}
         
-        # Calculate shares
-        owner_amount = amount * 0.5  # 50% to owner
-        partner_amount = amount * 0.5  # 50% to partner
+        # bool is an int subclass, but True isn't an amount
+        if type(amount_cents) is not int:
+            return {"success": False, "error": "Amount must be an integer number of cents"}
+        
+        # Split 50/50 in whole cents; an odd cent goes to the partner so
+        # the shares always add up to the total
+        owner_cents = amount_cents >> 1
+        partner_cents = amount_cents - owner_cents
         
         # In a real implementation, this would call Stripe API
         # to transfer funds to the respective accounts
@@ -141,10 +166,41 @@ class SecurePaymentProcessor:
         return {
             "success": True,
             "app_id": app_id,
-            "total_amount": amount,
-            "owner_amount": owner_amount,
-            "partner_amount": partner_amount,
-            "timestamp": os.path.getmtime(self.keys_file) if os.path.exists(self.keys_file) else None
+            "total_cents": amount_cents,
+            "owner_cents": owner_cents,
+            "partner_cents": partner_cents,
+            "timestamp": self._keys_mtime
+        }
+    
+    def process_revenue_share_batch(self, amounts_cents, app_id):
+        """
+        Process many revenue share payments for an app at once
+        
+        Args:
+            amounts_cents (list): Payment amounts in cents
+            app_id (str): The app the payments belong to
+        
+        Returns:
+            dict: Result with per-payment owner and partner shares in cents
+        """
+        payment_info = self.get_payment_info()
+        if not payment_info:
+            return {"success": False, "error": "Payment information not configured"}
+        
+        if not all(type(amount) is int for amount in amounts_cents):
+            return {"success": False, "error": "Amounts must be integer numbers of cents"}
+        
+        # Same split as process_revenue_share, one pass per column
+        owner_cents = [amount >> 1 for amount in amounts_cents]
+        partner_cents = [amount - owner for amount, owner in zip(amounts_cents, owner_cents)]
+        
+        return {
+            "success": True,
+            "app_id": app_id,
+            "total_cents": list(amounts_cents),
+            "owner_cents": owner_cents,
+            "partner_cents": partner_cents,
+            "timestamp": self._keys_mtime
         }
 
 # Example usage
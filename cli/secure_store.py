@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Secure Store Module
+------------------
+Key derivation and file handling shared by the encrypted local data files.
+"""
+import os
+import base64
+import tempfile
+from cli.fernet_compat import AesGcmCipher, make_fernet
+from cli.machine_id import machine_fingerprint, sha256
+
+# Key scheme used for newly stored data:
+#   0 = legacy PBKDF2 + Fernet, only read from data written before the header
+#       layout, with its salt in a separate file
+#   2 = SHA-256 + AES-GCM
+KDF_VERSION = 2
+
+# Data files start with a header of one KDF version byte and the salt
+SALT_SIZE = 16
+HEADER_SIZE = 1 + SALT_SIZE
+
+# Directories already created by this process, so later calls skip makedirs
+_DIRS_ENSURED = set()
+
+# Ciphers already derived in this process, keyed by (KDF version, salt, machine info)
+_KEY_CACHE = {}
+
+def ensure_dir(path):
+    """Create a directory once per process"""
+    if path not in _DIRS_ENSURED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_ENSURED.add(path)
+
+def new_key_header():
+    """Return a (KDF version, salt) pair for data that has no stored key yet"""
+    return KDF_VERSION, os.urandom(SALT_SIZE)
+
+def split_header(data):
+    """Split encrypted file contents into (KDF version, salt, payload)
+    
+    Returns None for files written before the header layout. Those hold a
+    bare Fernet token, which is base64 text and so never starts with a
+    byte as small as a KDF version.
+    """
+    if not data or data[0] > KDF_VERSION:
+        return None
+    return data[0], data[1:HEADER_SIZE], data[HEADER_SIZE:]
+
+def _read_legacy_salt(legacy_salt_file):
+    """Read the separate salt file used before the header layout, if there is one"""
+    if not os.path.exists(legacy_salt_file):
+        return None
+    with open(legacy_salt_file, "rb") as f:
+        return f.read()
+
+def read_key_header(data_file, legacy_salt_file):
+    """
+    Read the key header that a data file was encrypted with
+    
+    Args:
+        data_file (str): Path of the encrypted data file
+        legacy_salt_file (str): Salt file used by data from before the header layout
+    
+    Returns:
+        tuple: (KDF version, salt), or None if there's no stored data
+    """
+    if not os.path.exists(data_file):
+        return None
+    
+    with open(data_file, "rb") as f:
+        header = split_header(f.read(HEADER_SIZE))
+    if header is not None:
+        return header[:2]
+    
+    legacy_salt = _read_legacy_salt(legacy_salt_file)
+    return None if legacy_salt is None else (0, legacy_salt)
+
+def read_encrypted(data_file, legacy_salt_file):
+    """
+    Read a data file along with the key header it was encrypted with
+    
+    Args:
+        data_file (str): Path of the encrypted data file
+        legacy_salt_file (str): Salt file used by data from before the header layout
+    
+    Returns:
+        tuple: ((KDF version, salt), encrypted payload), or None if there's no stored data
+    """
+    if not os.path.exists(data_file):
+        return None
+    
+    with open(data_file, "rb") as f:
+        file_data = f.read()
+    
+    header = split_header(file_data)
+    if header is not None:
+        return header[:2], header[2]
+    
+    # Data from before the header layout is a bare token keyed by the legacy salt
+    legacy_salt = _read_legacy_salt(legacy_salt_file)
+    return None if legacy_salt is None else ((0, legacy_salt), file_data)
+
+def write_encrypted(data_file, kdf_version, salt, encrypted_data, legacy_salt_file=None):
+    """
+    Store encrypted data behind the key header needed to derive its key again
+    
+    Args:
+        data_file (str): Path of the encrypted data file
+        kdf_version (int): KDF version the data was encrypted with
+        salt (bytes): Salt the data was encrypted with
+        encrypted_data (bytes): Encrypted payload
+        legacy_salt_file (str, optional): Salt file from before the header layout,
+            removed once the data no longer depends on it
+    """
+    write_atomic(data_file, bytes([kdf_version]) + salt + encrypted_data)
+    
+    # The separate salt file only served data from before the header layout
+    if legacy_salt_file is not None and os.path.exists(legacy_salt_file):
+        os.remove(legacy_salt_file)
+
+def write_atomic(path, data):
+    """Write bytes to path so readers see either the old file or the new one
+    
+    The data goes to a temp file in the same directory, is fsynced, and is
+    then renamed over the target, so a crash mid-write can't leave a
+    truncated file that no longer decrypts.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def derive_cipher(kdf_version, salt):
+    """
+    Derive the cipher for a KDF version and salt on this machine
+    
+    Args:
+        kdf_version (int): KDF version the data is encrypted with
+        salt (bytes): Salt the data is encrypted with
+    
+    Returns:
+        object: Cipher with encrypt(bytes) -> bytes and decrypt(bytes) -> bytes
+    """
+    # Use machine-specific info as password base
+    machine_info = machine_fingerprint()
+    
+    # Only derive the key once per salt and machine
+    cache_key = (kdf_version, salt, machine_info)
+    if cache_key in _KEY_CACHE:
+        return _KEY_CACHE[cache_key]
+    
+    password = machine_info.encode()
+    
+    # Generate key
+    if kdf_version == 0:
+        # Keep deriving legacy keys the old way so existing data still decrypts;
+        # cryptography is only imported here, so other key schemes never load it
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=100000,
+        )
+        cipher = make_fernet(base64.urlsafe_b64encode(kdf.derive(password)))
+    else:
+        # The password is a deterministic machine fingerprint with no entropy
+        # to stretch, so iterating the hash adds cost but no protection
+        raw_key = sha256(salt + password).digest()
+        
+        # AES-GCM runs straight on OpenSSL's AES-NI path without Fernet's
+        # base64 and HMAC framing, and takes the raw key
+        cipher = AesGcmCipher(raw_key)
+    _KEY_CACHE[cache_key] = cipher
+    return cipher
@@ -5,13 +5,14 @@ Signature Handler Module
 Securely manages digital signatures for legal documents.
 """
 import os
-import base64
-import hashlib
+import shutil
 from pathlib import Path
 from datetime import datetime
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cli.machine_id import sha256
+from cli.secure_store import (
+    KDF_VERSION, derive_cipher, ensure_dir, new_key_header,
+    read_encrypted, read_key_header, write_encrypted
+)
 
 class SignatureHandler:
     """Handles secure signature operations"""
@@ -21,51 +22,26 @@ class SignatureHandler:
         self.secure_dir = os.path.join(Path.home(), "Str8ZeROCLI", "secure")
         self.signature_file = os.path.join(self.secure_dir, "signature.enc")
         
+        # Salt file used by data from before the key header layout
+        self.legacy_salt_file = os.path.join(self.secure_dir, "sig_salt.bin")
+        
         # Ensure directory exists
-        os.makedirs(self.secure_dir, exist_ok=True)
+        ensure_dir(self.secure_dir)
         
         # Initialize encryption
         self._setup_encryption()
     
     def _setup_encryption(self):
         """Set up encryption for secure storage"""
-        # Use a device-specific salt (or create one if it doesn't exist)
-        salt_file = os.path.join(self.secure_dir, "sig_salt.bin")
-        if os.path.exists(salt_file):
-            with open(salt_file, "rb") as f:
-                self.salt = f.read()
-        else:
-            self.salt = os.urandom(16)
-            with open(salt_file, "wb") as f:
-                f.write(self.salt)
-        
-        # Use machine-specific info as password base
-        machine_info = self._get_machine_info()
-        password = machine_info.encode()
-        
-        # Generate key
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password))
-        self.cipher = Fernet(key)
+        # Reuse the KDF version and salt of existing data; a new salt is only
+        # persisted with the first stored data
+        header = read_key_header(self.signature_file, self.legacy_salt_file)
+        self._init_cipher(*(header or new_key_header()))
     
-    def _get_machine_info(self):
-        """Get unique machine info for encryption"""
-        # This is a simplified version - in production use more robust machine fingerprinting
-        import platform
-        import uuid
-        
-        # Get machine-specific identifiers
-        system_info = platform.system() + platform.version()
-        machine_id = str(uuid.getnode())  # MAC address as integer
-        
-        # Combine and hash
-        combined = system_info + machine_id
-        return hashlib.sha256(combined.encode()).hexdigest()
+    def _init_cipher(self, kdf_version, salt):
+        """Switch to the cipher for a KDF version and salt"""
+        self.kdf_version, self.salt = kdf_version, salt
+        self.cipher = derive_cipher(kdf_version, salt)
     
     def store_signature(self, signature_data):
         """
@@ -78,12 +54,21 @@ class SignatureHandler:
             bool: True if successful, False otherwise
         """
         try:
-            # Encrypt the signature data
+            # Another handler may have stored a signature since this one was
+            # set up; keep using its salt rather than replacing it
+            header = read_key_header(self.signature_file, self.legacy_salt_file)
+            if header is not None and header != (self.kdf_version, self.salt):
+                self._init_cipher(*header)
+            
+            # Move data from older key schemes to the current one as it's rewritten
+            if self.kdf_version != KDF_VERSION:
+                self._init_cipher(*new_key_header())
+            
+            # Encrypt the data
             encrypted_data = self.cipher.encrypt(signature_data)
             
-            # Save to file
-            with open(self.signature_file, "wb") as f:
-                f.write(encrypted_data)
+            # Save to file, prefixed with the header needed to derive the key again
+            write_encrypted(self.signature_file, self.kdf_version, self.salt, encrypted_data, self.legacy_salt_file)
             
             return True
         except Exception:
@@ -96,13 +81,16 @@ class SignatureHandler:
         Returns:
             bytes: The signature data, or None if not found
         """
-        if not os.path.exists(self.signature_file):
-            return None
-        
         try:
-            # Read encrypted data
-            with open(self.signature_file, "rb") as f:
-                encrypted_data = f.read()
+            # Read encrypted data along with the key header it was written with
+            stored = read_encrypted(self.signature_file, self.legacy_salt_file)
+            if stored is None:
+                return None
+            header, encrypted_data = stored
+            
+            # Another handler may have stored it with a different salt
+            if header != (self.kdf_version, self.salt):
+                self._init_cipher(*header)
             
             # Decrypt
             return self.cipher.decrypt(encrypted_data)
@@ -120,34 +108,85 @@ class SignatureHandler:
         Returns:
             str: Path to the signed document
         """
-        # In a real implementation, this would use a PDF library to apply the signature
-        # For now, we'll just append a signature line to text documents
+        # PDFs get the signature stamped onto their last page; any other
+        # document is treated as text and gets a signature block appended
         
         if output_path is None:
             output_path = document_path.replace('.', '_signed.')
         
+        signature_lines = [
+            "Signed by: Alex Trujillo",
+            f"Date: {datetime.now().strftime('%Y-%m-%d')}",
+            f"Signature ID: {self._generate_signature_id()}"
+        ]
+        
         try:
-            # Read the document
-            with open(document_path, 'r') as f:
-                content = f.read()
+            if document_path.lower().endswith('.pdf'):
+                self._apply_signature_to_pdf(document_path, output_path, signature_lines)
+                return output_path
+            
+            # Build the signature block once; the text-mode write this replaced
+            # translated newlines to the platform convention, so keep doing that
+            signature_line = "\n\n" + "\n".join(signature_lines) + "\n"
+            signature_bytes = signature_line.replace("\n", os.linesep).encode()
             
-            # Add signature line
-            signature_line = f"\n\nSigned by: Alex Trujillo\nDate: {datetime.now().strftime('%Y-%m-%d')}\nSignature ID: {self._generate_signature_id()}\n"
-            content += signature_line
+            # Copy the document in the kernel (sendfile/copy_file_range where
+            # available) instead of reading it into memory
+            if os.path.abspath(output_path) != os.path.abspath(document_path):
+                shutil.copyfile(document_path, output_path)
             
-            # Write the signed document
-            with open(output_path, 'w') as f:
-                f.write(content)
+            # Append the signature line
+            with open(output_path, 'ab') as f:
+                f.write(signature_bytes)
             
             return output_path
         except Exception as e:
             print(f"Error applying signature: {e}")
             return None
     
+    def _apply_signature_to_pdf(self, document_path, output_path, signature_lines):
+        """
+        Stamp the signature lines onto the last page of a PDF
+        
+        Uses pikepdf (bindings to the C++ QPDF library), which is only
+        imported when a PDF is actually signed.
+        
+        Args:
+            document_path (str): Path to the PDF
+            output_path (str): Path to save the signed PDF
+            signature_lines (list): Lines of text to stamp
+        """
+        import pikepdf
+        
+        with pikepdf.open(document_path, allow_overwriting_input=True) as pdf:
+            page = pdf.pages[-1]
+            
+            # Register a standard font under a name the page doesn't already use
+            font = pdf.make_indirect(pikepdf.Dictionary(
+                Type=pikepdf.Name.Font,
+                Subtype=pikepdf.Name.Type1,
+                BaseFont=pikepdf.Name.Helvetica
+            ))
+            font_name = page.add_resource(font, pikepdf.Name.Font, prefix="Sig")
+            
+            # Draw the lines near the bottom-left corner of the page
+            left, bottom = float(page.mediabox[0]), float(page.mediabox[1])
+            operators = [f"BT {font_name} 10 Tf 12 TL {left + 36:.2f} {bottom + 60:.2f} Td"]
+            for line in signature_lines:
+                escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+                operators.append(f"({escaped}) Tj T*")
+            operators.append("ET")
+            
+            # Isolate the page's own graphics state so it can't move our text
+            page.contents_add(pikepdf.Stream(pdf, b"q"), prepend=True)
+            page.contents_add(pikepdf.Stream(pdf, ("Q " + " ".join(operators)).encode()))
+            
+            pdf.save(output_path)
+    
     def _generate_signature_id(self):
         """Generate a unique signature ID"""
         timestamp = datetime.now().isoformat()
-        unique_id = hashlib.sha256(f"Alex Trujillo:{timestamp}".encode()).hexdigest()
+        unique_id = sha256(f"Alex Trujillo:{timestamp}".encode()).hexdigest()
         return unique_id[:16]
 
 # Example usage
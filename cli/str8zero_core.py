@@ -7,6 +7,11 @@ Coordinates all agents and processes to transform user intent into profitable ap
 """
 import os
 import json
+import time
+import logging
+import logging.handlers
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +23,76 @@ from cli.agents.deploy import deploy_to_targets
 from cli.agents.marketing import generate_marketing_plan
 from cli.agents.monetization import setup_monetization
 from cli.memory.kernel import load_user_profile, save_user_profile
+from cli.secure_store import ensure_dir
+
+# Log lines are held in memory and written in one go when a build finishes,
+# or earlier if this many pile up
+LOG_BUFFER_CAPACITY = 1000
+
+# Buffering handler in front of the core operations log file, shared by all engines
+_log_handler = None
+_log_handler_lock = threading.Lock()
+
+class _CoreLogFormatter(logging.Formatter):
+    """Formats core log records with local ISO timestamps including microseconds"""
+    
+    def __init__(self):
+        super().__init__("[%(asctime)s] [%(user_context)s] [%(stage)s] %(message)s")
+        
+        # Formatted date/time for the current second, reused by records in that second
+        self._second = None
+        self._second_text = ""
+    
+    def formatTime(self, record, datefmt=None):
+        """Return the record's creation time in ISO format with microseconds"""
+        second = int(record.created)
+        
+        # Only re-run strftime when the second changes
+        if second != self._second:
+            self._second = second
+            self._second_text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        
+        return f"{self._second_text}.{int((record.created - second) * 1e6):06d}"
+
+def _get_core_logger(log_path):
+    """
+    Get the core operations logger, pointing its buffered handler at log_path
+    
+    Args:
+        log_path (str): Path of the core operations log file
+    
+    Returns:
+        tuple: (logger, buffering handler)
+    """
+    global _log_handler
+    logger = logging.getLogger("str8zero.core")
+    
+    log_path = os.path.abspath(log_path)
+    handler = _log_handler
+    if handler is not None and handler.target.baseFilename == log_path:
+        return logger, handler
+    
+    # Engines are built on worker threads, so only one may install the handler
+    with _log_handler_lock:
+        if _log_handler is None or _log_handler.target.baseFilename != log_path:
+            if _log_handler is not None:
+                logger.removeHandler(_log_handler)
+                _log_handler.close()
+            
+            file_handler = logging.FileHandler(log_path)
+            file_handler.setFormatter(_CoreLogFormatter())
+            
+            # Nothing but capacity or an explicit flush empties the buffer
+            _log_handler = logging.handlers.MemoryHandler(
+                LOG_BUFFER_CAPACITY,
+                flushLevel=logging.CRITICAL + 1,
+                target=file_handler
+            )
+            logger.addHandler(_log_handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        
+        return logger, _log_handler
 
 class Str8ZeroCore:
     """Core orchestration engine for Str8ZeROCLI business OS"""
@@ -28,16 +103,49 @@ class Str8ZeroCore:
         self.user_context = user_context
         self.prompt = prompt
         self.memory = load_user_profile(user_context)
+        
+        # The profile loaded above is current until the first build uses it
+        self._memory_is_current = True
         self.log_path = os.path.join(Path.home(), "Str8ZeROCLI", "logs", "core_operations.log")
         
         # Ensure log directory exists
-        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        ensure_dir(os.path.dirname(self.log_path))
         
-        # Log initialization
-        self._log_operation("init", f"Core initialized with prompt: {prompt[:50]}...")
+        self._logger, self._log_handler = _get_core_logger(self.log_path)
+        
+        # Log initialization; engines kept for reuse start without a prompt
+        if prompt:
+            self._log_operation("init", f"Core initialized with prompt: {prompt[:50]}...")
     
-    def build(self):
-        """Execute the full build pipeline"""
+    def build(self, prompt=None):
+        """
+        Execute the full build pipeline
+        
+        Args:
+            prompt (str, optional): New prompt to build, so one engine can be
+                reused across builds; defaults to the prompt it was created with
+        
+        Returns:
+            dict: Results of every build stage
+        """
+        if prompt is not None:
+            self.prompt = prompt
+            self.timestamp = datetime.now().isoformat()
+            self._log_operation("build", f"Starting build for prompt: {prompt[:50]}...")
+        
+        # A reused engine reloads the profile, so history saved since its
+        # last build (by the CLI or another process) isn't overwritten
+        if not self._memory_is_current:
+            self.memory = load_user_profile(self.user_context)
+        self._memory_is_current = False
+        
+        try:
+            return self._run_pipeline()
+        finally:
+            self._flush_log()
+    
+    def _run_pipeline(self):
+        """Run each build stage in order and collect the results"""
         # Step 1: Semantic analysis
         self._log_operation("semantic", "Interpreting user intent")
         self.intent = interpret_prompt(self.prompt, self.memory)
@@ -46,17 +154,23 @@ class Str8ZeroCore:
         self._log_operation("logic", f"Generating app logic for domain: {self.intent.get('domain', 'unknown')}")
         self.logic = generate_app_logic(self.intent)
         
-        # Step 3: Generate UI
-        self._log_operation("visual", "Creating adaptive UI")
-        self.visual = generate_ui(self.intent, self.logic)
-        
-        # Step 4: Setup monetization
-        self._log_operation("monetize", "Configuring revenue streams")
-        self.monetization = setup_monetization(self.intent, self.logic)
-        
-        # Step 5: Generate marketing plan
-        self._log_operation("marketing", "Creating marketing strategy")
-        self.marketing = generate_marketing_plan(self.intent, self.logic)
+        # Steps 3-5 only depend on intent and logic, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Step 3: Generate UI
+            self._log_operation("visual", "Creating adaptive UI")
+            visual_future = executor.submit(generate_ui, self.intent, self.logic)
+            
+            # Step 4: Setup monetization
+            self._log_operation("monetize", "Configuring revenue streams")
+            monetization_future = executor.submit(setup_monetization, self.intent, self.logic)
+            
+            # Step 5: Generate marketing plan
+            self._log_operation("marketing", "Creating marketing strategy")
+            marketing_future = executor.submit(generate_marketing_plan, self.intent, self.logic)
+            
+            self.visual = visual_future.result()
+            self.monetization = monetization_future.result()
+            self.marketing = marketing_future.result()
         
         # Step 6: Deploy to targets
         self._log_operation("deploy", "Preparing deployment package")
@@ -82,7 +196,19 @@ class Str8ZeroCore:
             "deployment": self.deployment
         }
     
+    def flush(self):
+        """
+        Write any queued lines to the core operations log
+        
+        The log file itself stays open: its handler is shared by every engine
+        in the process, and logging's exit hook closes it.
+        """
+        self._flush_log()
+    
     def _log_operation(self, stage, message):
-        """Log an operation to the core operations log"""
-        with open(self.log_path, 'a') as f:
-            f.write(f"[{datetime.now().isoformat()}] [{self.user_context}] [{stage}] {message}\n")
\ No newline at end of file
+        """Queue an operation for the core operations log"""
+        self._logger.info(message, extra={"user_context": self.user_context, "stage": stage})
+    
+    def _flush_log(self):
+        """Write all queued log lines to the core operations log"""
+        self._log_handler.flush()
@@ -1,7 +1,11 @@
 import sys
 import os
 import json
+import asyncio
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -9,8 +13,9 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
                             QPushButton, QLabel, QLineEdit, QTextEdit, QComboBox, 
                             QTabWidget, QProgressBar, QFrame, QGridLayout, QSpacerItem,
                             QSizePolicy, QCheckBox, QGroupBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QTextCursor
+import qasync
 
 # Add parent directory to path to import CLI modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,50 +23,134 @@ from cli.market_analysis import MarketAnalyzer
 from cli.app_generator import AppGenerator
 from cli.str8zero_core import Str8ZeroCore
 
-class WorkerThread(QThread):
-    """Worker thread to run operations without freezing UI"""
-    update_signal = pyqtSignal(dict)
-    finished_signal = pyqtSignal(dict)
+# Stylesheets shared by widgets across the tabs
+TABS_QSS = """
+    QTabWidget::pane { 
+        border: 1px solid #444; 
+        background-color: #2D2D2D;
+        border-radius: 5px;
+    }
+    QTabBar::tab {
+        background-color: #1E1E1E;
+        color: white;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+    }
+    QTabBar::tab:selected {
+        background-color: #2D2D2D;
+        border-bottom: 2px solid #00F0FF;
+    }
+"""
+
+BUTTON_QSS = """
+    QPushButton {
+        background-color: #00A3FF;
+        color: white;
+        border-radius: 5px;
+        padding: 10px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #0078D7;
+    }
+"""
+
+PANEL_QSS = "background-color: #2D2D2D; border-radius: 5px;"
+TEXT_QSS = "background-color: #1E1E1E; color: white; border-radius: 5px;"
+STAT_QSS = "color: #00F0FF; font-weight: bold;"
+
+# Workers share these instead of constructing a fresh one for every job
+
+@lru_cache(maxsize=1)
+def _analyzer():
+    """Get the shared market analyzer"""
+    return MarketAnalyzer()
+
+@lru_cache(maxsize=1)
+def _generator():
+    """Get the shared app generator"""
+    return AppGenerator()
+
+@lru_cache(maxsize=8)
+def _core(user_context):
+    """Get the shared core engine for a profile"""
+    return Str8ZeroCore(user_context=user_context, prompt="")
+
+# A build stores its stages on the engine and rewrites the profile's history,
+# so builds for one profile can't overlap. The locks outlive evicted engines:
+# a replacement engine must wait for a build still running on the old one
+_build_locks = {}
+
+def _build_lock(user_context):
+    """Get the lock serializing builds for a profile"""
+    return _build_locks.setdefault(user_context, threading.Lock())
+
+# lru_cache can run a factory more than once when first calls race on
+# worker threads, so the factories are only ever called under this lock
+_shared_lock = threading.Lock()
+
+def _shared(factory, *args):
+    """Get the shared instance a factory above returns for args"""
+    with _shared_lock:
+        return factory(*args)
+
+@lru_cache(maxsize=1)
+def _dark_palette():
+    """Build the dark palette applied to the whole application"""
+    dark_palette = QPalette()
+    dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.WindowText, Qt.white)
+    dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
+    dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ToolTipBase, Qt.white)
+    dark_palette.setColor(QPalette.ToolTipText, Qt.white)
+    dark_palette.setColor(QPalette.Text, Qt.white)
+    dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ButtonText, Qt.white)
+    dark_palette.setColor(QPalette.BrightText, Qt.red)
+    dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
+    dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+    dark_palette.setColor(QPalette.HighlightedText, Qt.black)
     
-    def __init__(self, operation, params):
-        super().__init__()
-        self.operation = operation
-        self.params = params
-        
-    def run(self):
-        try:
-            result = {}
-            
-            if self.operation == "market_analysis":
-                analyzer = MarketAnalyzer()
-                result = analyzer.analyze_market(
-                    category=self.params.get("category"),
-                    keywords=self.params.get("keywords")
-                )
-                self.update_signal.emit({"status": "Analyzing market data..."})
-                
-            elif self.operation == "generate_app":
-                generator = AppGenerator()
-                result = generator.generate_app(
-                    app_name=self.params.get("app_name"),
-                    app_type=self.params.get("app_type"),
-                    features=self.params.get("features"),
-                    platform=self.params.get("platform")
-                )
-                self.update_signal.emit({"status": "Generating app code..."})
-                
-            elif self.operation == "build":
-                core = Str8ZeroCore(
-                    user_context=self.params.get("profile", "default"),
-                    prompt=self.params.get("prompt")
-                )
-                self.update_signal.emit({"status": "Analyzing prompt..."})
-                result = core.build()
-                
-            self.finished_signal.emit({"operation": self.operation, "result": result})
-            
-        except Exception as e:
-            self.finished_signal.emit({"operation": self.operation, "error": str(e)})
+    return dark_palette
+
+# Status shown while each operation runs
+OPERATION_STATUS = {
+    "market_analysis": "Analyzing market data...",
+    "generate_app": "Generating app code...",
+    "build": "Analyzing prompt..."
+}
+
+def _analyze_market(params):
+    """Run a market analysis with the shared analyzer"""
+    return _shared(_analyzer).analyze_market(
+        category=params.get("category"),
+        keywords=params.get("keywords")
+    )
+
+def _generate_app(params):
+    """Generate app code with the shared generator"""
+    return _shared(_generator).generate_app(
+        app_name=params.get("app_name"),
+        app_type=params.get("app_type"),
+        features=params.get("features"),
+        platform=params.get("platform")
+    )
+
+def _build(params):
+    """Build an app with the profile's shared core engine"""
+    profile = params.get("profile", "default")
+    with _shared(_build_lock, profile):
+        return _shared(_core, profile).build(prompt=params.get("prompt"))
+
+# Blocking call behind each operation; these run on a worker thread
+OPERATIONS = {
+    "market_analysis": _analyze_market,
+    "generate_app": _generate_app,
+    "build": _build
+}
 
 class Str8ZeroCockpit(QMainWindow):
     """Main cockpit interface for Str8ZeROCLI"""
@@ -71,36 +160,21 @@ class Str8ZeroCockpit(QMainWindow):
         self.setWindowTitle("Str8ZeRO Command Cockpit")
         self.setMinimumSize(1200, 800)
         
-        # Set dark theme
-        self.set_dark_theme()
+        # Statistics shown on the monitor tab; the labels only display these
+        self._apps_generated = 0
+        self._analyses = 0
+        self._revenue = 0.0
+        
+        # Log entries are queued and written to the log view in batches, so a
+        # burst of entries costs one layout and repaint instead of one each
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         
         # Initialize UI
         self.init_ui()
         
-        # Status updates
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(5000)  # Update every 5 seconds
-        
-    def set_dark_theme(self):
-        """Set dark theme for the application"""
-        dark_palette = QPalette()
-        dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.WindowText, Qt.white)
-        dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ToolTipBase, Qt.white)
-        dark_palette.setColor(QPalette.ToolTipText, Qt.white)
-        dark_palette.setColor(QPalette.Text, Qt.white)
-        dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ButtonText, Qt.white)
-        dark_palette.setColor(QPalette.BrightText, Qt.red)
-        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.HighlightedText, Qt.black)
-        
-        self.setPalette(dark_palette)
-        
     def init_ui(self):
         """Initialize the user interface"""
         # Main widget and layout
@@ -126,25 +200,7 @@ class Str8ZeroCockpit(QMainWindow):
         
         # Tab widget
         tab_widget = QTabWidget()
-        tab_widget.setStyleSheet("""
-            QTabWidget::pane { 
-                border: 1px solid #444; 
-                background-color: #2D2D2D;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                background-color: #1E1E1E;
-                color: white;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            QTabBar::tab:selected {
-                background-color: #2D2D2D;
-                border-bottom: 2px solid #00F0FF;
-            }
-        """)
+        tab_widget.setStyleSheet(TABS_QSS)
         
         # Create tabs
         market_tab = self.create_market_tab()
@@ -172,7 +228,7 @@ class Str8ZeroCockpit(QMainWindow):
         
         # Controls
         controls_frame = QFrame()
-        controls_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        controls_frame.setStyleSheet(PANEL_QSS)
         controls_layout = QGridLayout(controls_frame)
         
         # Category
@@ -192,24 +248,13 @@ class Str8ZeroCockpit(QMainWindow):
         
         # Analyze button
         analyze_button = QPushButton("Analyze Market")
-        analyze_button.setStyleSheet("""
-            QPushButton {
-                background-color: #00A3FF;
-                color: white;
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0078D7;
-            }
-        """)
+        analyze_button.setStyleSheet(BUTTON_QSS)
         analyze_button.clicked.connect(self.analyze_market)
         controls_layout.addWidget(analyze_button, 2, 0, 1, 2)
         
         # Results
         results_frame = QFrame()
-        results_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        results_frame.setStyleSheet(PANEL_QSS)
         results_layout = QVBoxLayout(results_frame)
         
         results_label = QLabel("Market Analysis Results")
@@ -218,7 +263,7 @@ class Str8ZeroCockpit(QMainWindow):
         
         results_text = QTextEdit()
         results_text.setReadOnly(True)
-        results_text.setStyleSheet("background-color: #1E1E1E; color: white; border-radius: 5px;")
+        results_text.setStyleSheet(TEXT_QSS)
         results_layout.addWidget(results_text)
         self.market_results_text = results_text
         
@@ -235,7 +280,7 @@ class Str8ZeroCockpit(QMainWindow):
         
         # Prompt input
         prompt_frame = QFrame()
-        prompt_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        prompt_frame.setStyleSheet(PANEL_QSS)
         prompt_layout = QVBoxLayout(prompt_frame)
         
         prompt_label = QLabel("Enter your app idea:")
@@ -244,13 +289,13 @@ class Str8ZeroCockpit(QMainWindow):
         
         prompt_input = QTextEdit()
         prompt_input.setPlaceholderText("Describe your app idea in detail...")
-        prompt_input.setStyleSheet("background-color: #1E1E1E; color: white; border-radius: 5px;")
+        prompt_input.setStyleSheet(TEXT_QSS)
         prompt_layout.addWidget(prompt_input)
         self.prompt_input = prompt_input
         
         # Options
         options_frame = QFrame()
-        options_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        options_frame.setStyleSheet(PANEL_QSS)
         options_layout = QGridLayout(options_frame)
         
         # Platform
@@ -275,24 +320,13 @@ class Str8ZeroCockpit(QMainWindow):
         
         # Build button
         build_button = QPushButton("Build App")
-        build_button.setStyleSheet("""
-            QPushButton {
-                background-color: #00A3FF;
-                color: white;
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0078D7;
-            }
-        """)
+        build_button.setStyleSheet(BUTTON_QSS)
         build_button.clicked.connect(self.build_app)
         options_layout.addWidget(build_button, 3, 0, 1, 2)
         
         # Results
         results_frame = QFrame()
-        results_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        results_frame.setStyleSheet(PANEL_QSS)
         results_layout = QVBoxLayout(results_frame)
         
         results_label = QLabel("Build Results")
@@ -301,7 +335,7 @@ class Str8ZeroCockpit(QMainWindow):
         
         results_text = QTextEdit()
         results_text.setReadOnly(True)
-        results_text.setStyleSheet("background-color: #1E1E1E; color: white; border-radius: 5px;")
+        results_text.setStyleSheet(TEXT_QSS)
         results_layout.addWidget(results_text)
         self.build_results_text = results_text
         
@@ -319,7 +353,7 @@ class Str8ZeroCockpit(QMainWindow):
         
         # App details
         details_frame = QFrame()
-        details_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        details_frame.setStyleSheet(PANEL_QSS)
         details_layout = QGridLayout(details_frame)
         
         # App name
@@ -352,24 +386,13 @@ class Str8ZeroCockpit(QMainWindow):
         
         # Generate button
         generate_button = QPushButton("Generate Code")
-        generate_button.setStyleSheet("""
-            QPushButton {
-                background-color: #00A3FF;
-                color: white;
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0078D7;
-            }
-        """)
+        generate_button.setStyleSheet(BUTTON_QSS)
         generate_button.clicked.connect(self.generate_code)
         details_layout.addWidget(generate_button, 4, 0, 1, 2)
         
         # Results
         results_frame = QFrame()
-        results_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        results_frame.setStyleSheet(PANEL_QSS)
         results_layout = QVBoxLayout(results_frame)
         
         results_label = QLabel("Generation Results")
@@ -378,7 +401,7 @@ class Str8ZeroCockpit(QMainWindow):
         
         results_text = QTextEdit()
         results_text.setReadOnly(True)
-        results_text.setStyleSheet("background-color: #1E1E1E; color: white; border-radius: 5px;")
+        results_text.setStyleSheet(TEXT_QSS)
         results_layout.addWidget(results_text)
         self.generate_results_text = results_text
         
@@ -395,33 +418,33 @@ class Str8ZeroCockpit(QMainWindow):
         
         # Stats
         stats_frame = QFrame()
-        stats_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        stats_frame.setStyleSheet(PANEL_QSS)
         stats_layout = QGridLayout(stats_frame)
         
         # Apps generated
         stats_layout.addWidget(QLabel("Apps Generated:"), 0, 0)
         apps_generated_label = QLabel("0")
-        apps_generated_label.setStyleSheet("color: #00F0FF; font-weight: bold;")
+        apps_generated_label.setStyleSheet(STAT_QSS)
         stats_layout.addWidget(apps_generated_label, 0, 1)
         self.apps_generated_label = apps_generated_label
         
         # Market analyses
         stats_layout.addWidget(QLabel("Market Analyses:"), 1, 0)
         analyses_label = QLabel("0")
-        analyses_label.setStyleSheet("color: #00F0FF; font-weight: bold;")
+        analyses_label.setStyleSheet(STAT_QSS)
         stats_layout.addWidget(analyses_label, 1, 1)
         self.analyses_label = analyses_label
         
         # Estimated revenue
         stats_layout.addWidget(QLabel("Est. Monthly Revenue:"), 2, 0)
         revenue_label = QLabel("$0.00")
-        revenue_label.setStyleSheet("color: #00F0FF; font-weight: bold;")
+        revenue_label.setStyleSheet(STAT_QSS)
         stats_layout.addWidget(revenue_label, 2, 1)
         self.revenue_label = revenue_label
         
         # Log
         log_frame = QFrame()
-        log_frame.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        log_frame.setStyleSheet(PANEL_QSS)
         log_layout = QVBoxLayout(log_frame)
         
         log_label = QLabel("Activity Log")
@@ -430,7 +453,8 @@ class Str8ZeroCockpit(QMainWindow):
         
         log_text = QTextEdit()
         log_text.setReadOnly(True)
-        log_text.setStyleSheet("background-color: #1E1E1E; color: white; border-radius: 5px;")
+        log_text.setStyleSheet(TEXT_QSS)
+        log_text.document().setMaximumBlockCount(2000)
         log_layout.addWidget(log_text)
         self.log_text = log_text
         
@@ -452,14 +476,11 @@ class Str8ZeroCockpit(QMainWindow):
         self.status_label.setText("Status: Analyzing market...")
         self.add_log_entry(f"Starting market analysis for category: {category}")
         
-        # Start worker thread
-        self.worker = WorkerThread("market_analysis", {
+        # Run the job off the UI thread
+        self._start_operation("market_analysis", {
             "category": category,
             "keywords": keywords
         })
-        self.worker.update_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.handle_result)
-        self.worker.start()
     
     def build_app(self):
         """Build app based on user prompt"""
@@ -475,16 +496,13 @@ class Str8ZeroCockpit(QMainWindow):
         self.status_label.setText("Status: Building app...")
         self.add_log_entry(f"Starting app build for prompt: {prompt[:50]}...")
         
-        # Start worker thread
-        self.worker = WorkerThread("build", {
+        # Run the job off the UI thread
+        self._start_operation("build", {
             "prompt": prompt,
             "platform": platform,
             "profile": profile,
             "explain": explain
         })
-        self.worker.update_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.handle_result)
-        self.worker.start()
     
     def generate_code(self):
         """Generate code based on user input"""
@@ -502,24 +520,37 @@ class Str8ZeroCockpit(QMainWindow):
         self.status_label.setText("Status: Generating code...")
         self.add_log_entry(f"Starting code generation for app: {app_name}")
         
-        # Start worker thread
-        self.worker = WorkerThread("generate_app", {
+        # Run the job off the UI thread
+        self._start_operation("generate_app", {
             "app_name": app_name,
             "app_type": app_type,
             "features": features,
             "platform": platform
         })
-        self.worker.update_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.handle_result)
-        self.worker.start()
+    
+    def _start_operation(self, operation, params):
+        """Schedule an operation on the asyncio event loop"""
+        asyncio.ensure_future(self._run_operation(operation, params))
+    
+    async def _run_operation(self, operation, params):
+        """Run an operation on a worker thread and show its result"""
+        self.update_progress({"status": OPERATION_STATUS[operation]})
+        
+        try:
+            result = await asyncio.to_thread(OPERATIONS[operation], params)
+        except Exception as e:
+            self.handle_result({"operation": operation, "error": str(e)})
+            return
+        
+        self.handle_result({"operation": operation, "result": result})
     
     def update_progress(self, data):
-        """Update progress based on worker thread signal"""
+        """Update the status label with an operation's progress"""
         if "status" in data:
             self.status_label.setText(f"Status: {data['status']}")
     
     def handle_result(self, data):
-        """Handle result from worker thread"""
+        """Handle the result of an operation"""
         operation = data.get("operation")
         
         if "error" in data:
@@ -542,19 +573,29 @@ class Str8ZeroCockpit(QMainWindow):
             opportunities = result.get("opportunities", [])
             competition = result.get("competition_analysis", {})
             
-            output = f"Analysis completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            output += f"Apps analyzed: {result.get('apps_analyzed', 0)}\n"
-            output += f"Competition level: {competition.get('level', 'unknown').upper()}\n\n"
-            
-            output += f"Opportunities found: {len(opportunities)}\n\n"
+            # Collect the lines and join once, rather than copying the text on every +=
+            parts = [
+                f"Analysis completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+                f"Apps analyzed: {result.get('apps_analyzed', 0)}",
+                f"Competition level: {competition.get('level', 'unknown').upper()}",
+                "",
+                f"Opportunities found: {len(opportunities)}",
+                ""
+            ]
             
             for i, opp in enumerate(opportunities):
-                output += f"{i+1}. {opp.get('type', '').replace('_', ' ').title()}\n"
-                output += f"   {opp.get('description', '')}\n"
-                output += f"   Potential: {opp.get('potential', '').upper()}\n\n"
+                parts.extend([
+                    f"{i+1}. {opp.get('type', '').replace('_', ' ').title()}",
+                    f"   {opp.get('description', '')}",
+                    f"   Potential: {opp.get('potential', '').upper()}",
+                    ""
+                ])
+            parts.append("")
             
-            self.market_results_text.setText(output)
-            self.analyses_label.setText(str(int(self.analyses_label.text()) + 1))
+            self.market_results_text.setText("\n".join(parts))
+            self._analyses += 1
+            self.analyses_label.setText(str(self._analyses))
             
         elif operation == "build":
             # Update build results
@@ -562,37 +603,47 @@ class Str8ZeroCockpit(QMainWindow):
             logic = result.get("logic", {})
             monetization = result.get("monetization", {})
             
-            output = f"Build completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            output += f"App Type: {logic.get('app_type', 'unknown')}\n"
-            output += f"Domain: {intent.get('domain', 'unknown')}\n"
-            output += f"Features: {', '.join(logic.get('features', []))}\n\n"
-            
-            output += f"Monetization Model: {monetization.get('model', 'unknown')}\n"
             revenue = monetization.get("revenue_potential", {})
-            output += f"Estimated Monthly Revenue: ${revenue.get('estimated_monthly_revenue', 0)}\n"
-            output += f"Estimated Annual Revenue: ${revenue.get('estimated_annual_revenue', 0)}\n\n"
             
-            output += f"Deployment Targets: {', '.join(result.get('deployment', {}).get('targets', []))}\n"
+            parts = [
+                f"Build completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+                f"App Type: {logic.get('app_type', 'unknown')}",
+                f"Domain: {intent.get('domain', 'unknown')}",
+                f"Features: {', '.join(logic.get('features', []))}",
+                "",
+                f"Monetization Model: {monetization.get('model', 'unknown')}",
+                f"Estimated Monthly Revenue: ${revenue.get('estimated_monthly_revenue', 0)}",
+                f"Estimated Annual Revenue: ${revenue.get('estimated_annual_revenue', 0)}",
+                "",
+                f"Deployment Targets: {', '.join(result.get('deployment', {}).get('targets', []))}",
+                ""
+            ]
             
-            self.build_results_text.setText(output)
-            self.apps_generated_label.setText(str(int(self.apps_generated_label.text()) + 1))
+            self.build_results_text.setText("\n".join(parts))
+            self._apps_generated += 1
+            self.apps_generated_label.setText(str(self._apps_generated))
             
             # Update revenue
-            current_revenue = float(self.revenue_label.text().replace("$", ""))
-            new_revenue = current_revenue + revenue.get('estimated_monthly_revenue', 0)
-            self.revenue_label.setText(f"${new_revenue:.2f}")
+            self._revenue += float(revenue.get('estimated_monthly_revenue', 0))
+            self.revenue_label.setText(f"${self._revenue:,.2f}")
             
         elif operation == "generate_app":
             # Update generate results
-            output = f"Code generation completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            output += f"App Name: {result.get('app_name', 'unknown')}\n"
-            output += f"Files Generated: {result.get('files_generated', 0)}\n"
-            output += f"Platforms: {', '.join(result.get('platforms', []))}\n\n"
+            parts = [
+                f"Code generation completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+                f"App Name: {result.get('app_name', 'unknown')}",
+                f"Files Generated: {result.get('files_generated', 0)}",
+                f"Platforms: {', '.join(result.get('platforms', []))}",
+                "",
+                f"App Directory: {result.get('app_dir', '')}",
+                ""
+            ]
             
-            output += f"App Directory: {result.get('app_dir', '')}\n"
-            
-            self.generate_results_text.setText(output)
-            self.apps_generated_label.setText(str(int(self.apps_generated_label.text()) + 1))
+            self.generate_results_text.setText("\n".join(parts))
+            self._apps_generated += 1
+            self.apps_generated_label.setText(str(self._apps_generated))
         
         self.status_label.setText("Status: Ready")
         self.add_log_entry(f"Completed {operation}")
@@ -600,18 +651,49 @@ class Str8ZeroCockpit(QMainWindow):
     def add_log_entry(self, message):
         """Add entry to log"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(100)
     
-    def update_status(self):
-        """Update status periodically"""
-        # This would normally check system status, running jobs, etc.
-        pass
+    def _flush_log(self):
+        """Write queued log entries to the log view in one go"""
+        if not self._log_buffer:
+            return
+        
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        if not self.log_text.document().isEmpty():
+            text = "\n" + text
+        
+        self.log_text.setUpdatesEnabled(False)
+        cursor = QTextCursor(self.log_text.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.log_text.setUpdatesEnabled(True)
+        
+        # Keep the newest entries in view, as append did
+        scroll_bar = self.log_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
 
 def main():
     app = QApplication(sys.argv)
+    
+    # Set the dark theme once for the application so every widget inherits it
+    app.setStyle("Fusion")
+    app.setPalette(_dark_palette())
+    
+    # Run asyncio on top of Qt's event loop, so operations can await the
+    # worker threads their blocking calls are handed to
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2)))
+    
     window = Str8ZeroCockpit()
     window.show()
-    sys.exit(app.exec_())
+    
+    with loop:
+        loop.run_forever()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
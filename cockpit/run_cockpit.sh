@@ -3,9 +3,9 @@
 
 echo -e "\n🚀 Launching Str8ZeRO Command Cockpit..."
 
-# Check if PyQt5 is installed
-if ! python -c "import PyQt5" &> /dev/null; then
-    echo -e "\n⚠️ PyQt5 not found. Installing required packages..."
+# Check if PyQt5 and qasync are installed
+if ! python -c "import PyQt5, qasync" &> /dev/null; then
+    echo -e "\n⚠️ PyQt5 or qasync not found. Installing required packages..."
     pip install -r requirements.txt
 fi
 
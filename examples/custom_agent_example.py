@@ -3,8 +3,14 @@
 Custom Agent Example: MusicAgent
 """
 import os
+import random
 import requests
 
+# Vibe vocabulary, built once rather than on every prompt
+_MUSIC_STYLES = ("jazz", "electronic", "classical", "hip-hop", "ambient")
+_EMOTIONS = ("melancholic", "uplifting", "energetic", "contemplative", "dreamy")
+_RNG = random.Random()
+
 class Agent:
     """Custom agent implementation for music generation"""
     
@@ -40,12 +46,8 @@ class Agent:
             
             if task == "vibe-gen":
                 # Generate music-themed vibes
-                music_styles = ["jazz", "electronic", "classical", "hip-hop", "ambient"]
-                emotions = ["melancholic", "uplifting", "energetic", "contemplative", "dreamy"]
-                
-                import random
-                style = random.choice(music_styles)
-                emotion = random.choice(emotions)
+                style = _RNG.choice(_MUSIC_STYLES)
+                emotion = _RNG.choice(_EMOTIONS)
                 
                 output = f"'{prompt}' translates to {emotion} {style} with subtle rhythmic patterns"
                 
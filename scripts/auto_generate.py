@@ -1,28 +1,40 @@
 import os
 from datetime import datetime
 
+try:
+    from scripts.auto_generate_all import read_docs, render_docs
+except ImportError:
+    # Run directly as scripts/auto_generate.py
+    from auto_generate_all import read_docs, render_docs
+
 # Project root path
 PROJECT_ROOT = r"c:\Users\jay10\NIS development eco-system\Str8ZeROCLI_repo"
 
+# Directories created so far in this run
+_KNOWN_DIRS = set()
+
+def _ensure_dir(path):
+    if path not in _KNOWN_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _KNOWN_DIRS.add(path)
+
 def write_to_file(relative_path, content):
     abs_path = os.path.join(PROJECT_ROOT, relative_path)
-    os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+    _ensure_dir(os.path.dirname(abs_path))
     with open(abs_path, 'w', encoding='utf-8') as f:
         f.write(content)
     print(f"[{datetime.now()}] Wrote: {abs_path}")
     return abs_path
 
 def update_docs(module, filename, description):
-    docs_path = os.path.join(PROJECT_ROOT, 'docs', f'{module}.md')
-    os.makedirs(os.path.dirname(docs_path), exist_ok=True)
-    doc_entry = f"\n### `{filename}`\n{description}\n"
+    # Shares docs/generated.md with auto_generate_all.py, so merge the entry in
+    docs_path = os.path.join(PROJECT_ROOT, 'docs', 'generated.md')
+    _ensure_dir(os.path.dirname(docs_path))
+    sections = read_docs(docs_path)
+    sections.setdefault(module, {})[filename] = description
     
-    if os.path.exists(docs_path):
-        with open(docs_path, 'a', encoding='utf-8') as f:
-            f.write(doc_entry)
-    else:
-        with open(docs_path, 'w', encoding='utf-8') as f:
-            f.write(f"# {module.capitalize()} Module\n{doc_entry}")
+    with open(docs_path, 'wb') as f:
+        f.write(b''.join(render_docs(sections)))
     print(f"[{datetime.now()}] Updated docs: {docs_path}")
 
 def auto_generate(module, filename, content, description):
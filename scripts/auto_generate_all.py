@@ -1,58 +1,237 @@
 #!/usr/bin/env python3
 import os
+import sys
+import ctypes
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 
 # Set project path
 PROJECT_ROOT = r"c:\Users\jay10\NIS development eco-system\Str8ZeROCLI_repo"
 
-def write_to_file(relative_path, content):
-    """Write content to file, creating directories as needed"""
-    abs_path = os.path.join(PROJECT_ROOT, relative_path)
-    os.makedirs(os.path.dirname(abs_path), exist_ok=True)
-    with open(abs_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"[{datetime.now()}] Wrote: {abs_path}")
-    return abs_path
+# Folder each module's files are generated into, relative to PROJECT_ROOT;
+# read-only so nothing can change the layout after the paths below are built
+_FOLDER_MAP = MappingProxyType({
+    'backend': 'backend/',
+    'frontend': 'frontend/',
+    'agents': 'cli/agents/',
+    'memory': 'cli/memory/',
+    'components': 'frontend/components/',
+    'scripts': 'scripts/',
+    'cli': 'cli/',
+    'config': 'config/',
+    'docs': 'docs/',
+})
+
+# The same folders as absolute paths, joined once rather than per file
+_ABS_FOLDERS = MappingProxyType({
+    module: os.path.join(PROJECT_ROOT, folder) for module, folder in _FOLDER_MAP.items()
+})
+
+# Folder the generated docs file is written to
+_DOCS_DIR = os.path.join(PROJECT_ROOT, 'docs')
+_DOCS_FILE = os.path.join(_DOCS_DIR, 'generated.md')
+
+# Print a line for every file and docs update, not just the final summary
+_VERBOSE = False
+
+# Output lines collected during a run and printed together at the end
+_log_lines = []
+
+# Docs descriptions queued by update_docs, by filename per module, merged into
+# docs/generated.md by _flush_docs
+_doc_buffers = {}
+
+# Sizes of the files about to be generated that already exist, by path,
+# filled by _scan_existing
+_existing_sizes = {}
+
+# Files queued by auto_generate as (absolute path, content), written by flush_pending
+_pending_writes = []
+
+# CreateDirectoryW makes a folder in one call, where os.makedirs stats it first
+if os.name == 'nt':
+    _CreateDirectoryW = ctypes.WinDLL('kernel32', use_last_error=True).CreateDirectoryW
+    _CreateDirectoryW.argtypes = [ctypes.c_wchar_p, ctypes.c_void_p]
+    _CreateDirectoryW.restype = ctypes.c_int
+else:
+    _CreateDirectoryW = None
+
+ERROR_ALREADY_EXISTS = 183
+
+def _mkdir(dir_path):
+    """Create a directory if it doesn't exist yet"""
+    if _CreateDirectoryW is not None:
+        if _CreateDirectoryW(dir_path, None) or ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            return
+    # Missing parents (or any other failure) go through makedirs, which raises properly
+    os.makedirs(dir_path, exist_ok=True)
+
+def _scan_existing(dir_path, file_paths):
+    """Record the sizes of the given files that already exist in a folder"""
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                # Only stat the files about to be generated; on POSIX every
+                # stat is a syscall, and the folders hold other files too
+                if entry.path in file_paths and entry.is_file():
+                    _existing_sizes[entry.path] = entry.stat().st_size
+    except FileNotFoundError:
+        pass
+
+def _ensure_dirs(targets):
+    """
+    Create each output folder once and record which target files already exist
+    
+    Args:
+        targets (dict): Paths of the files about to be generated, keyed by folder
+    """
+    # Shortest paths first, so parent folders exist before their children
+    for dir_path in sorted(targets, key=len):
+        _mkdir(dir_path)
+        _scan_existing(dir_path, targets[dir_path])
+
+def _has_content(path, chunks):
+    """Check whether the file at path already holds exactly these byte chunks"""
+    # Only files scanned with the same size need reading
+    if _existing_sizes.get(path) != sum(map(len, chunks)):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            existing = memoryview(f.read())
+    except OSError:
+        return False
+    
+    offset = 0
+    for chunk in chunks:
+        if existing[offset:offset + len(chunk)] != chunk:
+            return False
+        offset += len(chunk)
+    return True
+
+def _write_chunks(fd, chunks):
+    """Write byte chunks to fd in order, with one writev call where available"""
+    if not hasattr(os, 'writev'):
+        # Windows has no writev, so join the chunks for a plain write
+        remaining = memoryview(b''.join(chunks))
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+        return
+    
+    views = [memoryview(chunk) for chunk in chunks if chunk]
+    while views:
+        written = os.writev(fd, views)
+        # Drop the chunks that went out; a short write can stop mid-chunk
+        while views and written >= len(views[0]):
+            written -= len(views.pop(0))
+        if written:
+            views[0] = views[0][written:]
+
+def write_to_file(abs_path, content):
+    """Write content bytes, or a list of byte chunks, to a file whose folder already exists"""
+    chunks = [content] if isinstance(content, bytes) else content
+    
+    # Re-runs mostly regenerate identical files; leave those untouched
+    if _has_content(abs_path, chunks):
+        if _VERBOSE:
+            _log_lines.append(f"[{datetime.now()}] Unchanged: {abs_path}")
+        return
+    
+    # Ready-made bytes need none of open()'s buffering layers
+    fd = os.open(abs_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        _write_chunks(fd, chunks)
+    finally:
+        os.close(fd)
+    
+    if _VERBOSE:
+        _log_lines.append(f"[{datetime.now()}] Wrote: {abs_path}")
+
+def read_docs(docs_path):
+    """
+    Read the entries of a generated docs file
+    
+    Args:
+        docs_path (str): Path of the generated docs file
+    
+    Returns:
+        dict: Descriptions keyed by filename, per module, in file order
+    """
+    sections = {}
+    if not os.path.exists(docs_path):
+        return sections
+    
+    entries = description = None
+    with open(docs_path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line.startswith('## '):
+                entries = sections.setdefault(line[3:], {})
+                description = None
+            elif line.startswith('### `') and line.endswith('`') and entries is not None:
+                description = entries.setdefault(line[5:-1], [])
+                description.clear()
+            elif line and description is not None:
+                description.append(line)
+    
+    return {module: {filename: '\n'.join(lines) for filename, lines in entries.items()}
+            for module, entries in sections.items()}
+
+def render_docs(sections):
+    """
+    Render docs entries as the byte chunks of a generated docs file
+    
+    Args:
+        sections (dict): Descriptions keyed by filename, per module
+    
+    Returns:
+        list: Encoded chunks, in file order
+    """
+    chunks = [b"# Generated Files\n"]
+    for module, entries in sections.items():
+        chunks.append(f"\n## {module}\n".encode('utf-8'))
+        for filename, description in entries.items():
+            chunks.append(f"\n### `{filename}`\n{description}\n".encode('utf-8'))
+    return chunks
 
 def update_docs(module, filename, description):
-    """Update or create documentation for a file"""
-    docs_path = os.path.join(PROJECT_ROOT, 'docs', f'{module}.md')
-    os.makedirs(os.path.dirname(docs_path), exist_ok=True)
-    doc_entry = f"\n### `{filename}`\n{description}\n"
+    """Queue a documentation entry for a file"""
+    _doc_buffers.setdefault(module, {})[filename] = description
+
+def _flush_docs():
+    """Merge every queued documentation entry into the one generated docs file"""
+    # Entries from other generators stay; this run's entries replace their
+    # earlier versions instead of piling up on every re-run
+    sections = read_docs(_DOCS_FILE)
+    for module, entries in _doc_buffers.items():
+        sections.setdefault(module, {}).update(entries)
     
-    if os.path.exists(docs_path):
-        with open(docs_path, 'a', encoding='utf-8') as f:
-            f.write(doc_entry)
-    else:
-        with open(docs_path, 'w', encoding='utf-8') as f:
-            f.write(f"# {module.capitalize()} Module\n{doc_entry}")
-    print(f"[{datetime.now()}] Updated docs: {docs_path}")
+    # The entries go out as separate chunks, without joining them into one buffer
+    write_to_file(_DOCS_FILE, render_docs(sections))
+    _doc_buffers.clear()
 
 def auto_generate(module, filename, content, description):
     """Generate code file and documentation"""
-    folder_map = {
-        'backend': 'backend/',
-        'frontend': 'frontend/',
-        'agents': 'cli/agents/',
-        'memory': 'cli/memory/',
-        'components': 'frontend/components/',
-        'scripts': 'scripts/',
-        'cli': 'cli/',
-        'config': 'config/',
-        'docs': 'docs/',
-    }
-    
-    folder = folder_map.get(module, '')
-    rel_path = os.path.join(folder, filename)
-    abs_path = write_to_file(rel_path, content)
+    folder = _ABS_FOLDERS.get(module, PROJECT_ROOT)
+    abs_path = os.path.join(folder, filename)
+    _pending_writes.append((abs_path, content))
     update_docs(module, filename, description)
     return abs_path
 
-def generate_all_files():
-    """Generate all core files for the project"""
-    # Create backend structure
-    auto_generate('backend', 'main.py', 
-        '''from fastapi import FastAPI, Request
+def flush_pending():
+    """Write every file queued by auto_generate in one batch"""
+    # The folders already exist and the files are independent, so let their
+    # open/write/close calls overlap
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda item: write_to_file(*item), _pending_writes))
+    _pending_writes.clear()
+
+# Every generated file as (module, filename, content, description); the
+# contents are ASCII, so bytes literals need no encoding at all
+_FILES = (
+    # Backend structure
+    ('backend', 'main.py', b'''from fastapi import FastAPI, Request
 from str8zero_core import Str8ZeroCore
 
 app = FastAPI()
@@ -65,11 +244,10 @@ async def build_app(request: Request):
     core = Str8ZeroCore(user_context, prompt)
     result = core.build()
     return result
-''', 
-        "FastAPI entrypoint for the Str8ZeROCLI backend.")
+''',
+        "FastAPI entrypoint for the Str8ZeROCLI backend."),
     
-    auto_generate('backend', 'str8zero_core.py', 
-        '''from agents.semantic import interpret_prompt
+    ('backend', 'str8zero_core.py', b'''from agents.semantic import interpret_prompt
 from agents.logic import generate_app_logic
 from agents.visual import generate_ui
 from agents.deploy import deploy_to_targets
@@ -90,12 +268,11 @@ class Str8ZeroCore:
             "visual": self.visual,
             "deployment": self.deployment
         }
-''', 
-        "Core orchestration engine for Str8ZeROCLI.")
+''',
+        "Core orchestration engine for Str8ZeROCLI."),
     
-    # Create agent files
-    auto_generate('agents', 'semantic.py', 
-        '''def interpret_prompt(prompt):
+    # Agent files
+    ('agents', 'semantic.py', b'''def interpret_prompt(prompt):
     """Interpret user prompt to extract intent, emotion, and domain"""
     # TODO: Integrate with NLP/LLM for better understanding
     return {
@@ -103,11 +280,10 @@ class Str8ZeroCore:
         "emotion": "frustration",
         "domain": "billing"
     }
-''', 
-        "Semantic analysis agent for interpreting user prompts.")
+''',
+        "Semantic analysis agent for interpreting user prompts."),
     
-    auto_generate('agents', 'logic.py', 
-        '''def generate_app_logic(intent):
+    ('agents', 'logic.py', b'''def generate_app_logic(intent):
     """Generate app logic based on user intent"""
     domain = intent.get("domain", "")
     
@@ -123,11 +299,10 @@ class Str8ZeroCore:
         }
     
     return {"app_type": "generic", "features": []}
-''', 
-        "Logic generation agent for creating app blueprints.")
+''',
+        "Logic generation agent for creating app blueprints."),
     
-    auto_generate('agents', 'visual.py', 
-        '''def generate_ui(intent):
+    ('agents', 'visual.py', b'''def generate_ui(intent):
     """Generate UI based on user intent"""
     emotion = intent.get("emotion", "neutral")
     
@@ -147,11 +322,10 @@ class Str8ZeroCore:
         "color_scheme": color_scheme,
         "layout": "adaptive"
     }
-''', 
-        "Visual design agent for creating UI/UX.")
+''',
+        "Visual design agent for creating UI/UX."),
     
-    auto_generate('agents', 'deploy.py', 
-        '''def deploy_to_targets(logic, visual, memory):
+    ('agents', 'deploy.py', b'''def deploy_to_targets(logic, visual, memory):
     """Deploy app to target platforms"""
     app_type = logic.get("app_type", "generic")
     
@@ -165,12 +339,11 @@ class Str8ZeroCore:
         "status": "pending",
         "instructions": "Ready for deployment"
     }
-''', 
-        "Deployment agent for publishing apps to various platforms.")
+''',
+        "Deployment agent for publishing apps to various platforms."),
     
-    # Create memory module
-    auto_generate('memory', 'kernel.py', 
-        '''def load_user_profile(user_context):
+    # Memory module
+    ('memory', 'kernel.py', b'''def load_user_profile(user_context):
     """Load user profile and preferences"""
     # TODO: Implement actual storage/retrieval
     return {
@@ -184,12 +357,11 @@ def save_user_profile(user_context, profile):
     # TODO: Implement actual storage
     print(f"Saving profile for {user_context}")
     return True
-''', 
-        "Memory kernel for storing and retrieving user context.")
+''',
+        "Memory kernel for storing and retrieving user context."),
     
-    # Create frontend components
-    auto_generate('components', 'GlassPanel.tsx', 
-        '''import React from 'react';
+    # Frontend components
+    ('components', 'GlassPanel.tsx', b'''import React from 'react';
 import { View, StyleSheet } from 'react-native';
 
 export default function GlassPanel({ children }) {
@@ -213,11 +385,10 @@ const styles = StyleSheet.create({
     margin: 10,
   },
 });
-''', 
-        "Glassmorphic UI component for modern interfaces.")
+''',
+        "Glassmorphic UI component for modern interfaces."),
     
-    auto_generate('components', 'AnimatedSignal.tsx', 
-        '''import React, { useEffect } from 'react';
+    ('components', 'AnimatedSignal.tsx', b'''import React, { useEffect } from 'react';
 import { View, StyleSheet, Animated } from 'react-native';
 
 export default function AnimatedSignal() {
@@ -269,10 +440,33 @@ const styles = StyleSheet.create({
     margin: 5,
   },
 });
-''', 
-        "Animated signal component for visual feedback.")
+''',
+        "Animated signal component for visual feedback."),
+)
 
-    print(f"[{datetime.now()}] All files generated successfully!")
+def generate_all_files():
+    """Generate all core files for the project"""
+    start = time.monotonic()
+    
+    # Every folder written to, created together before any file is queued
+    targets = {_DOCS_DIR: {_DOCS_FILE}}
+    for module, filename, *_ in _FILES:
+        folder = _ABS_FOLDERS.get(module, PROJECT_ROOT)
+        targets.setdefault(folder, set()).add(os.path.join(folder, filename))
+    _ensure_dirs(targets)
+    
+    for entry in _FILES:
+        auto_generate(*entry)
+    
+    # Write the queued files and docs together
+    flush_pending()
+    _flush_docs()
+    
+    # One console write for the whole run rather than one per file
+    _log_lines.append(f"Generated {len(_FILES)} files in {time.monotonic() - start:.3f}s")
+    sys.stdout.write('\n'.join(_log_lines) + '\n')
+    _log_lines.clear()
 
 if __name__ == "__main__":
+    _VERBOSE = "--verbose" in sys.argv[1:]
     generate_all_files()
\ No newline at end of file